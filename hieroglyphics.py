@@ -18,8 +18,113 @@ Date: 2025
 Based on: Gardiner's Egyptian Hieroglyphic Sign List and Unicode Egyptian Hieroglyphs standard
 """
 
+import codecs
+import functools
 import re
-from typing import List, Tuple, Union, Dict
+import sys
+import types
+from typing import List, Mapping, Optional, Tuple, Dict
+
+
+# Control character used to join batch inputs into one buffer; it never
+# appears in realistic text and is kept as-is by the batch lookup table
+_BATCH_SEPARATOR = '\x01'
+
+# Conversions of short inputs (words, commands, examples) are memoized;
+# longer texts are converted directly so the cache never pins
+# large strings in memory
+_CONVERT_CACHE_SIZE = 4096
+_CONVERT_CACHE_MAX_LENGTH = 256
+
+# Most entries an explanation table keeps. About 200 are filled at init (the
+# supported characters plus the placeholder for every unsupported Latin-1
+# character), leaving the rest for wider characters seen at runtime
+_EXPLANATION_CACHE_SIZE = 4096
+
+# Smallest batch worth shipping to worker processes; below this, process
+# start-up and pickling cost more than the conversion itself
+_PARALLEL_MIN_BATCH = 1024
+
+# Explanation for whitespace outside the maps' own space entry
+_WORD_SEPARATOR_EXPLANATION = "[space] → [space] (word separator)"
+
+# Whitespace outside Latin-1, which the byte tables cannot represent
+_WIDE_WHITESPACE_RE = re.compile(r'[^\S\x00-\xff]')
+
+
+def _convert_bytes(text: str, table: str, deleted: bytes) -> str:
+    """
+    Convert text through a 256-entry byte lookup table.
+
+    Args:
+        text (str): Text to convert
+        table (str): Byte-indexed decoding table
+        deleted (bytes): Byte values dropped before decoding
+
+    Returns:
+        str: The converted hieroglyphic text
+    """
+    try:
+        data = text.encode('latin-1')
+    except UnicodeEncodeError:
+        # Wider text is lowercased first (a few non-Latin-1 characters,
+        # such as the Kelvin sign, lowercase to ASCII letters). Wide
+        # whitespace becomes a space; anything else still outside Latin-1
+        # encodes as '?', which converts to the stroke placeholder like
+        # any other unsupported character.
+        data = _WIDE_WHITESPACE_RE.sub(' ', text.lower()).encode('latin-1', 'replace')
+    data = data.translate(None, deleted)
+    return codecs.charmap_decode(data, 'strict', table)[0]
+
+
+# Memoized conversion shared by every converter. The tables are part of the
+# key, so converters with different maps never share results, and the cache
+# holds no reference to any converter instance.
+_cached_convert = functools.lru_cache(maxsize=_CONVERT_CACHE_SIZE)(_convert_bytes)
+
+
+# One converter per class inside each worker process, built on first use
+_worker_converters = {}
+
+
+def _batch_worker(converter_class: type, text_list: List[str]) -> List[str]:
+    """
+    Convert one chunk of a parallel batch inside a worker process.
+
+    Args:
+        converter_class (type): Class of the converter that started the batch
+        text_list (list): Chunk of strings to convert
+
+    Returns:
+        list: List of converted hieroglyphic strings
+    """
+    converter = _worker_converters.get(converter_class)
+    if converter is None:
+        converter = _worker_converters[converter_class] = converter_class()
+    # Call the in-process path directly so an overridden batch_convert is
+    # not applied a second time inside the worker
+    return HieroglyphicsConverter.batch_convert(converter, text_list)
+
+
+class _ExplanationTable(dict):
+    """
+    Character -> explanation table that also explains unsupported characters.
+
+    Placeholder explanations are formatted the first time a character is seen
+    and then remembered, so repeated unsupported characters cost a plain dict
+    hit; the cap keeps hostile input from growing the table without bound.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, char):
+        if char.isspace():
+            explanation = _WORD_SEPARATOR_EXPLANATION
+        else:
+            explanation = f"'{char}' → 𓏤 (unsupported → stroke placeholder)"
+        if len(self) < _EXPLANATION_CACHE_SIZE:
+            self[char] = explanation
+        return explanation
 
 
 class HieroglyphicsConverter:
@@ -36,8 +141,31 @@ class HieroglyphicsConverter:
     - Phonograms (sound signs) 
     - Determinatives (meaning clarifiers)
     - Complex spatial arrangements
+
+    Every table is built by __init__, so pickling, copying and the worker
+    processes of batch_convert recreate converters by calling the class with
+    no arguments; subclasses must keep that constructor signature.
     """
 
+    __slots__ = (
+        'hieroglyphic_map',
+        'special_chars',
+        'numbers',
+        'symbol_descriptions',
+        '_byte_deleted',
+        '_byte_table',
+        '_byte_batch_table',
+        '_explain',
+        '_byte_explain',
+        '_sorted_alphabet',
+        '_supported',
+        '_byte_unsupported',
+        '_unsupported_re',
+        '_alphabet_reference',
+        '_char_info',
+        '__weakref__',
+    )
+
     def __init__(self):
         """Initialize the converter with hieroglyphic mappings."""
 
@@ -84,6 +212,11 @@ class HieroglyphicsConverter:
             '-': '𓏤',   # Using stroke for hyphen
             "'": '',    # Apostrophe ignored (not used in ancient Egyptian)
             '"': '',    # Quotation marks ignored
+            '\t': ' ',   # Tab becomes a word separator
+            '\n': ' ',   # Newline becomes a word separator
+            '\r': ' ',   # Carriage return becomes a word separator
+            '\v': ' ',   # Vertical tab becomes a word separator
+            '\f': ' ',   # Form feed becomes a word separator
         }
 
         # Egyptian number system (simplified representation)
@@ -125,6 +258,138 @@ class HieroglyphicsConverter:
             '𓏤': 'Stroke (separator)',
         }
 
+        # Share one string object per distinct glyph across all maps (and every
+        # table derived from them below), so repeated glyphs cost no extra memory
+        # and compare by identity
+        for mapping in (self.hieroglyphic_map, self.special_chars, self.numbers):
+            for char, hieroglyph in mapping.items():
+                mapping[char] = sys.intern(hieroglyph)
+
+        # Unified character -> hieroglyph lookup across all three maps
+        unified = {**self.hieroglyphic_map, **self.special_chars, **self.numbers}
+
+        # Latin-1 whitespace other than the space itself (tab, newline, NBSP,
+        # ...) converts to a space and is explained as a word separator
+        latin1_spaces = [
+            chr(code) for code in range(256)
+            if chr(code).isspace() and chr(code) != ' '
+        ]
+
+        # Byte-indexed lookup table decoded with the C-level charmap codec, so
+        # conversion is a gather with no Python work per character. The text
+        # stays at one byte per character until the final glyph string is
+        # built. Latin-1 input needs no lowercasing pass, since upper- and
+        # lowercase letters share an entry (no non-ASCII Latin-1 character
+        # lowercases to a supported one). Characters that map to nothing
+        # cannot live in a charmap table, so they are deleted from the bytes
+        # beforehand.
+        byte_table = ['𓏤'] * 256
+        for char in latin1_spaces:
+            byte_table[ord(char)] = ' '
+        for char, hieroglyph in unified.items():
+            byte_table[ord(char)] = hieroglyph
+            byte_table[ord(char.upper())] = hieroglyph
+        self._byte_deleted = bytes(
+            ord(char) for char, hieroglyph in unified.items() if not hieroglyph
+        )
+        self._byte_table = ''.join(hieroglyph or '𓏤' for hieroglyph in byte_table)
+        byte_table[ord(_BATCH_SEPARATOR)] = _BATCH_SEPARATOR
+        self._byte_batch_table = ''.join(
+            hieroglyph or '𓏤' for hieroglyph in byte_table
+        )
+
+        # Explanation for every supported character, so the explanation loop
+        # is one dict fetch per character with no formatting
+        self._explain = _ExplanationTable()
+        for char, hieroglyph in self.numbers.items():
+            self._explain[char] = f"'{char}' → {hieroglyph} (Egyptian numeral)"
+        for char, hieroglyph in self.special_chars.items():
+            self._explain[char] = f"'{char}' → {hieroglyph} (punctuation)"
+        for char in latin1_spaces:
+            self._explain[char] = _WORD_SEPARATOR_EXPLANATION
+        for char, hieroglyph in self.hieroglyphic_map.items():
+            description = self.symbol_descriptions.get(hieroglyph, "Unknown symbol")
+            self._explain[char] = f"'{char}' → {hieroglyph} ({description})"
+
+        # Same explanations in a list indexed by codepoint for Latin-1 input;
+        # indexing a list by a byte value skips hashing entirely. Each entry
+        # explains the lowercased character, so lowercasing is folded into
+        # the lookup, and unsupported characters get their placeholder
+        # explanation up front too.
+        self._byte_explain = [self._explain[chr(code).lower()] for code in range(256)]
+
+        # (letter, hieroglyph, description) records in display order, so
+        # alphabet listings never need sorting or description lookups
+        self._sorted_alphabet = tuple(sorted(
+            (letter, hieroglyph, self.symbol_descriptions.get(hieroglyph, ""))
+            for letter, hieroglyph in self.hieroglyphic_map.items()
+        ))
+
+        # Every character validate_text accepts, built once for O(1) membership
+        self._supported = (
+            frozenset(self.hieroglyphic_map) |
+            frozenset(self.special_chars) |
+            frozenset(self.numbers)
+        )
+
+        # For each Latin-1 codepoint, the lowercased character validate_text
+        # would report, or None when it is supported
+        self._byte_unsupported = [
+            None if chr(code).lower() in self._supported else chr(code).lower()
+            for code in range(256)
+        ]
+
+        # Character class matching anything outside the supported set, so
+        # unsupported characters are found by the C-level regex scanner
+        self._unsupported_re = re.compile(
+            f"[^{re.escape(''.join(sorted(self._supported)))}]"
+        )
+
+        # Reference and per-character info strings never change after init,
+        # so format them once here instead of on every lookup
+        self._alphabet_reference = types.MappingProxyType({
+            letter: f"{hieroglyph} ({self.symbol_descriptions.get(hieroglyph, 'Unknown')})"
+            for letter, hieroglyph in self.hieroglyphic_map.items()
+        })
+        self._char_info = {}
+        for char, hieroglyph in self.numbers.items():
+            self._char_info[char] = f"'{char}' → {hieroglyph} (Egyptian numeral)"
+        for char, hieroglyph in self.special_chars.items():
+            self._char_info[char] = f"'{char}' → {hieroglyph} (special character/punctuation)"
+        for char in latin1_spaces:
+            self._char_info[char] = f"'{char}' → [space] (word separator)"
+        for char, hieroglyph in self.hieroglyphic_map.items():
+            description = self.symbol_descriptions.get(hieroglyph, "Unknown symbol")
+            self._char_info[char] = (
+                f"'{char}' → {hieroglyph} ({description}) - Egyptian hieroglyphic letter"
+            )
+
+        # Key the answers by the character as given, covering uppercase letters
+        # and unsupported Latin-1 characters too, so most lookups need neither
+        # lowercasing nor formatting
+        for code in range(256):
+            char = chr(code)
+            lowered = char.lower()
+            self._char_info[char] = self._char_info.get(
+                lowered,
+                f"'{lowered}' is not supported and will be replaced with 𓏤 (stroke placeholder)",
+            )
+
+        # Every table above is derived from these maps, so expose them
+        # read-only; editing them after init would otherwise be silently ignored
+        self.hieroglyphic_map = types.MappingProxyType(self.hieroglyphic_map)
+        self.special_chars = types.MappingProxyType(self.special_chars)
+        self.numbers = types.MappingProxyType(self.numbers)
+        self.symbol_descriptions = types.MappingProxyType(self.symbol_descriptions)
+
+    def __reduce__(self):
+        """
+        Pickle as a fresh instance; __init__ rebuilds every table.
+
+        Attributes a subclass keeps in its __dict__ are carried along.
+        """
+        return type(self), (), getattr(self, '__dict__', None)
+
     def convert_to_hieroglyphics(self, text: str) -> str:
         """
         Convert English text to Egyptian hieroglyphics.
@@ -141,29 +406,26 @@ class HieroglyphicsConverter:
         if not isinstance(text, str):
             raise ValueError("Input must be a string")
 
-        if not text.strip():
+        # isspace() stops at the first non-whitespace character and, unlike
+        # strip(), never allocates a copy
+        if not text or text.isspace():
             return ""
 
-        # Convert to lowercase for consistent mapping
-        text = text.lower()
+        if len(text) <= _CONVERT_CACHE_MAX_LENGTH:
+            return _cached_convert(text, self._byte_table, self._byte_deleted)
+        return self._convert(text)
 
-        # Convert each character
-        hieroglyphic_text = ""
-
-        for char in text:
-            if char in self.hieroglyphic_map:
-                hieroglyphic_text += self.hieroglyphic_map[char]
-            elif char in self.special_chars:
-                hieroglyphic_text += self.special_chars[char]
-            elif char in self.numbers:
-                hieroglyphic_text += self.numbers[char]
-            elif char.isspace():
-                hieroglyphic_text += ' '
-            else:
-                # For unsupported characters, use stroke placeholder
-                hieroglyphic_text += '𓏤'
+    def _convert(self, text: str) -> str:
+        """
+        Convert a non-empty string without the type check or the cache.
+
+        Args:
+            text (str): The English text to convert
 
-        return hieroglyphic_text
+        Returns:
+            str: The text converted to hieroglyphic symbols
+        """
+        return _convert_bytes(text, self._byte_table, self._byte_deleted)
 
     def convert_with_explanation(self, text: str) -> Tuple[str, List[str]]:
         """
@@ -181,36 +443,82 @@ class HieroglyphicsConverter:
         if not isinstance(text, str):
             raise ValueError("Input must be a string")
 
-        if not text.strip():
+        if not text or text.isspace():
             return "", []
 
+        # The glyph string comes from the C-level conversion path, so the
+        # code below only has to collect explanations
+        hieroglyphic_text = self.convert_to_hieroglyphics(text)
+
+        # Latin-1 text needs no lowercasing pass; the byte table handles case
+        try:
+            data = text.encode('latin-1')
+        except UnicodeEncodeError:
+            pass
+        else:
+            lookup = self._byte_explain
+            explanations = [lookup[code] for code in data]
+            return hieroglyphic_text, explanations
+
         text = text.lower()
-        hieroglyphic_text = ""
-        explanations = []
 
-        for char in text:
-            if char in self.hieroglyphic_map:
-                hieroglyph = self.hieroglyphic_map[char]
-                description = self.symbol_descriptions.get(hieroglyph, "Unknown symbol")
-                hieroglyphic_text += hieroglyph
-                explanations.append(f"'{char}' → {hieroglyph} ({description})")
-            elif char in self.special_chars:
-                hieroglyph = self.special_chars[char]
-                hieroglyphic_text += hieroglyph
-                explanations.append(f"'{char}' → {hieroglyph} (punctuation)")
-            elif char in self.numbers:
-                hieroglyph = self.numbers[char]
-                hieroglyphic_text += hieroglyph
-                explanations.append(f"'{char}' → {hieroglyph} (Egyptian numeral)")
-            elif char.isspace():
-                hieroglyphic_text += ' '
-                explanations.append(f"[space] → [space] (word separator)")
-            else:
-                hieroglyphic_text += '𓏤'
-                explanations.append(f"'{char}' → 𓏤 (unsupported → stroke placeholder)")
+        # Bind the table once so the loop does no attribute loads
+        explain = self._explain
+        explanations = [explain[char] for char in text]
 
         return hieroglyphic_text, explanations
 
+    def convert_full(self, text: str) -> Tuple[str, List[str], List[str]]:
+        """
+        Convert text with explanations and report unsupported characters in one call.
+
+        Unsupported characters are collected during the explanation pass, so
+        callers such as the interactive converter get the results of
+        convert_with_explanation and validate_text without a separate scan.
+
+        Args:
+            text (str): The English text to convert
+
+        Returns:
+            tuple: (hieroglyphic_text, list_of_explanations, list_of_unsupported_chars)
+
+        Raises:
+            ValueError: If input is not a string
+        """
+        if not isinstance(text, str):
+            raise ValueError("Input must be a string")
+
+        if not text or text.isspace():
+            # Nothing to explain, but whitespace can still be unsupported
+            return "", [], self.validate_text(text)[1]
+
+        hieroglyphic_text = self.convert_to_hieroglyphics(text)
+
+        # Dict keys keep the first-seen order validate_text reports
+        explanations = []
+        append = explanations.append
+        unsupported = {}
+
+        try:
+            data = text.encode('latin-1')
+        except UnicodeEncodeError:
+            explain = self._explain
+            supported = self._supported
+            for char in text.lower():
+                append(explain[char])
+                if char not in supported:
+                    unsupported[char] = None
+        else:
+            lookup = self._byte_explain
+            unsupported_of = self._byte_unsupported
+            for code in data:
+                append(lookup[code])
+                char = unsupported_of[code]
+                if char is not None:
+                    unsupported[char] = None
+
+        return hieroglyphic_text, explanations, list(unsupported)
+
     def get_character_info(self, char: str) -> str:
         """
         Get detailed information about a character's hieroglyphic representation.
@@ -224,34 +532,83 @@ class HieroglyphicsConverter:
         if len(char) != 1:
             return "Please provide a single character"
 
+        info = self._char_info.get(char)
+        if info is not None:
+            return info
+
         char = char.lower()
 
-        if char in self.hieroglyphic_map:
-            hieroglyph = self.hieroglyphic_map[char]
-            description = self.symbol_descriptions.get(hieroglyph, "Unknown symbol")
-            return f"'{char}' → {hieroglyph} ({description}) - Egyptian hieroglyphic letter"
-        elif char in self.special_chars:
-            hieroglyph = self.special_chars[char]
-            return f"'{char}' → {hieroglyph} (special character/punctuation)"
-        elif char in self.numbers:
-            hieroglyph = self.numbers[char]
-            return f"'{char}' → {hieroglyph} (Egyptian numeral)"
+        info = self._char_info.get(char)
+        if info is not None:
+            return info
         elif char.isspace():
             return f"'{char}' → [space] (word separator)"
-        else:
-            return f"'{char}' is not supported and will be replaced with 𓏤 (stroke placeholder)"
+        return f"'{char}' is not supported and will be replaced with 𓏤 (stroke placeholder)"
 
-    def batch_convert(self, text_list: List[str]) -> List[str]:
+    def batch_convert(self, text_list: List[str],
+                      max_workers: Optional[int] = None) -> List[str]:
         """
         Convert multiple texts to hieroglyphics.
 
         Args:
             text_list (list): List of strings to convert
+            max_workers (int, optional): Split large batches across this many
+                worker processes. By default everything is converted in-process.
+                Each worker builds its own converter of the same class, so the
+                class must be importable and constructible without arguments.
 
         Returns:
             list: List of converted hieroglyphic strings
+
+        Raises:
+            ValueError: If max_workers is less than 1
         """
-        return [self.convert_to_hieroglyphics(text) for text in text_list]
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        text_list = list(text_list)
+        if not text_list:
+            return []
+
+        if max_workers is not None and len(text_list) >= _PARALLEL_MIN_BATCH:
+            # Imported here since it pulls in logging and more, and only this
+            # opt-in path needs it
+            import concurrent.futures
+
+            # A few chunks per worker keeps them evenly loaded
+            chunk_count = max_workers * 4
+            chunk_size = -(-len(text_list) // chunk_count)
+            chunks = [
+                text_list[start:start + chunk_size]
+                for start in range(0, len(text_list), chunk_size)
+            ]
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return [
+                    result
+                    for converted in executor.map(
+                        _batch_worker, [type(self)] * len(chunks), chunks
+                    )
+                    for result in converted
+                ]
+
+        # Convert everything in one pass over a separator-joined buffer
+        try:
+            joined = _BATCH_SEPARATOR.join(text_list)
+        except TypeError:
+            joined = None
+
+        # Non-string entries (which must raise) or inputs containing the
+        # separator itself go through the per-item path
+        if joined is None or joined.count(_BATCH_SEPARATOR) != len(text_list) - 1:
+            return [self.convert_to_hieroglyphics(text) for text in text_list]
+
+        converted = _convert_bytes(joined, self._byte_batch_table, self._byte_deleted)
+
+        # Whitespace-only inputs convert to "", matching convert_to_hieroglyphics
+        return [
+            "" if text.isspace() else result
+            for text, result in zip(text_list, converted.split(_BATCH_SEPARATOR))
+        ]
 
     def get_alphabet_reference(self) -> Dict[str, str]:
         """
@@ -260,11 +617,29 @@ class HieroglyphicsConverter:
         Returns:
             dict: Dictionary mapping letters to hieroglyphs with descriptions
         """
-        reference = {}
-        for letter, hieroglyph in self.hieroglyphic_map.items():
-            description = self.symbol_descriptions.get(hieroglyph, "Unknown")
-            reference[letter] = f"{hieroglyph} ({description})"
-        return reference
+        # Return a copy so callers get the mutable dict they always have;
+        # use the alphabet_reference property to avoid the copy
+        return dict(self._alphabet_reference)
+
+    @property
+    def alphabet_reference(self) -> Mapping[str, str]:
+        """
+        Read-only view of the alphabet reference, built once at init.
+
+        Returns:
+            mapping: Letters mapped to hieroglyphs with descriptions
+        """
+        return self._alphabet_reference
+
+    @property
+    def sorted_alphabet(self) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Alphabet records in display order, built once at init.
+
+        Returns:
+            tuple: (letter, hieroglyph, description) records sorted by letter
+        """
+        return self._sorted_alphabet
 
     def validate_text(self, text: str) -> Tuple[bool, List[str]]:
         """
@@ -276,26 +651,74 @@ class HieroglyphicsConverter:
         Returns:
             tuple: (is_fully_supported, list_of_unsupported_chars)
         """
-        unsupported = []
-        all_supported_chars = (
-            set(self.hieroglyphic_map.keys()) |
-            set(self.special_chars.keys()) |
-            set(self.numbers.keys()) |
-            {' ', '\t', '\n'}
-        )
+        text = text.lower()
+
+        # Fully supported text (the common case) is confirmed by one regex scan
+        if self._unsupported_re.search(text) is None:
+            return True, []
+
+        # Otherwise take the set difference over distinct characters only;
+        # dict.fromkeys deduplicates in C and keeps the first-seen order
+        supported = self._supported
+        unsupported = [char for char in dict.fromkeys(text) if char not in supported]
+
+        return False, unsupported
+
+
+# Shared converter instance, created on first use so importing the module
+# does not pay for building the lookup tables
+_default_converter = None
+
+
+def get_default_converter() -> HieroglyphicsConverter:
+    """
+    Get the shared converter instance, creating it on first use.
+
+    Returns:
+        HieroglyphicsConverter: The module-wide converter
+    """
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = HieroglyphicsConverter()
+    return _default_converter
+
 
-        for char in text.lower():
-            if char not in all_supported_chars and char not in unsupported:
-                unsupported.append(char)
+def convert(text: str) -> str:
+    """
+    Convert English text to Egyptian hieroglyphics with the shared converter.
+
+    Args:
+        text (str): The English text to convert
 
-        return len(unsupported) == 0, unsupported
+    Returns:
+        str: The text converted to hieroglyphic symbols
+
+    Raises:
+        ValueError: If input is not a string
+    """
+    return get_default_converter().convert_to_hieroglyphics(text)
 
 
 def interactive_converter():
     """
     Interactive command-line interface for the hieroglyphics converter.
     """
-    converter = HieroglyphicsConverter()
+    converter = get_default_converter()
+
+    # The alphabet and examples output never changes, so render it once
+    # (trailing blank line included) and emit it with a single write
+    alphabet_rendered = "".join(
+        f"{letter.upper()}: {hieroglyph} ({description})\n"
+        for letter, hieroglyph, description in converter.sorted_alphabet
+    ) + "\n"
+    examples = [
+        "hello", "egypt", "pyramid", "pharaoh", 
+        "nile", "ancient", "hieroglyph", "123"
+    ]
+    convert = converter.convert_to_hieroglyphics
+    examples_rendered = "".join(
+        f"{example:12} → {convert(example)}\n" for example in examples
+    ) + "\n"
 
     print("="*70)
     print("🔺 ENGLISH TO EGYPTIAN HIEROGLYPHICS CONVERTER 🔺")
@@ -333,38 +756,26 @@ def interactive_converter():
             elif user_input.lower() == 'alphabet':
                 print("\nHIEROGLYPHIC ALPHABET REFERENCE:")
                 print("-" * 50)
-                reference = converter.get_alphabet_reference()
-                for letter in sorted(reference.keys()):
-                    print(f"{letter.upper()}: {reference[letter]}")
-                print()
+                sys.stdout.write(alphabet_rendered)
 
             elif user_input.lower() == 'examples':
                 print("\nCONVERSION EXAMPLES:")
                 print("-" * 30)
-                examples = [
-                    "hello", "egypt", "pyramid", "pharaoh", 
-                    "nile", "ancient", "hieroglyph", "123"
-                ]
-                for example in examples:
-                    converted = converter.convert_to_hieroglyphics(example)
-                    print(f"{example:12} → {converted}")
-                print()
+                sys.stdout.write(examples_rendered)
 
             else:
                 # Convert the input
                 print("\nCONVERSION RESULT:")
                 print("-" * 30)
 
-                # Check for unsupported characters
-                is_supported, unsupported = converter.validate_text(user_input)
-                if not is_supported:
+                # Convert with explanation and collect unsupported characters
+                hieroglyphic, explanations, unsupported = converter.convert_full(user_input)
+
+                if unsupported:
                     print(f"⚠️  Warning: Unsupported characters found: {unsupported}")
                     print("These will be replaced with 𓏤 (stroke placeholder)")
                     print()
 
-                # Perform conversion with explanation
-                hieroglyphic, explanations = converter.convert_with_explanation(user_input)
-
                 print(f"Original:     {user_input}")
                 print(f"Hieroglyphic: {hieroglyphic}")
                 print()
@@ -392,7 +803,7 @@ def demo_converter():
     print("="*70)
     print()
 
-    converter = HieroglyphicsConverter()
+    converter = get_default_converter()
 
     # Basic conversion examples
     print("1. BASIC CONVERSIONS:")
@@ -408,9 +819,10 @@ def demo_converter():
         "amazing discovery 123"
     ]
 
-    for text in demo_texts:
-        converted = converter.convert_to_hieroglyphics(text)
-        print(f"{text:20} → {converted}")
+    convert = converter.convert_to_hieroglyphics
+    sys.stdout.write("".join(
+        f"{text:20} → {convert(text)}\n" for text in demo_texts
+    ))
 
     print()
 
@@ -432,15 +844,13 @@ def demo_converter():
     print("3. HIEROGLYPHIC ALPHABET:")
     print("-" * 35)
 
-    alphabet = "abcdefghijklmnopqrstuvwxyz"
-    for i, letter in enumerate(alphabet):
-        hieroglyph = converter.hieroglyphic_map[letter]
-        description = converter.symbol_descriptions.get(hieroglyph, "")
-        print(f"{letter.upper()}: {hieroglyph} ({description})")
-
-        # Print in columns of 13
-        if i == 12:
-            print()
+    lines = [
+        f"{letter.upper()}: {hieroglyph} ({description})\n"
+        for letter, hieroglyph, description in converter.sorted_alphabet
+    ]
+    # Print in columns of 13
+    lines.insert(13, "\n")
+    sys.stdout.write("".join(lines))
 
     print()
 
@@ -448,9 +858,10 @@ def demo_converter():
     print("4. EGYPTIAN NUMERALS:")
     print("-" * 25)
 
-    for digit in "0123456789":
-        hieroglyph = converter.numbers[digit]
-        print(f"{digit}: {hieroglyph}")
+    numbers = converter.numbers
+    sys.stdout.write("".join(
+        f"{digit}: {numbers[digit]}\n" for digit in "0123456789"
+    ))
 
     print()
     print("="*70)